@@ -7,14 +7,10 @@ Provides commands for vault initialization and management.
 import os
 import sys
 import argparse
-from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.models.dashboard import Dashboard
-from src.utils.logger import setup_logger
-
 
 def init_vault(vault_path: str):
     """
@@ -34,14 +30,18 @@ def init_vault(vault_path: str):
         'Pending_Approval'
     ]
 
+    # Create each folder with its .gitkeep in one sweep
     for folder in folders:
         folder_path = os.path.join(vault_path, folder)
-        Path(folder_path).mkdir(parents=True, exist_ok=True)
+        os.makedirs(folder_path, exist_ok=True)
+        fd = os.open(os.path.join(folder_path, '.gitkeep'), os.O_CREAT | os.O_WRONLY, 0o644)
+        os.close(fd)
         print(f"  ✓ Created: {folder}/")
 
     # Create Dashboard.md if it doesn't exist
     dashboard_path = os.path.join(vault_path, 'Dashboard.md')
     if not os.path.exists(dashboard_path):
+        from src.models.dashboard import Dashboard
         dashboard = Dashboard(vault_path)
         dashboard.write()
         print(f"  ✓ Created: Dashboard.md")
@@ -56,11 +56,6 @@ def init_vault(vault_path: str):
     else:
         print(f"  ⚠ Company_Handbook.md already exists")
 
-    # Create .gitkeep files
-    for folder in folders:
-        gitkeep_path = os.path.join(vault_path, folder, '.gitkeep')
-        Path(gitkeep_path).touch()
-
     print(f"\n✅ Vault initialized successfully!")
     print(f"\nNext steps:")
     print(f"  1. Open vault in Obsidian: {vault_path}")
@@ -82,6 +77,9 @@ def rebuild_dashboard(vault_path: str):
         print(f"Error: Vault not found at {vault_path}")
         sys.exit(1)
 
+    # Imported here so --help and other commands don't load the model stack
+    from src.models.dashboard import Dashboard
+
     dashboard = Dashboard(vault_path)
     dashboard.update_stats(vault_path)
     dashboard.write()
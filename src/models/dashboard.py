@@ -5,14 +5,177 @@ Manages the Dashboard.md file with task statistics and recent activity.
 """
 
 import os
+import re
+import json
 from datetime import datetime, timezone
-from typing import List, Dict, Any
-from collections import Counter
+from typing import Deque, List, Dict, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.utils.yaml_handler import read_frontmatter_block, parse_frontmatter_only
+
+# Frontmatter cache for Done/ task files, stored at the vault root
+CACHE_FILENAME = '.dashboard-cache.json'
+
+# Summary counters written by Dashboard.write
+_STATS_RE = re.compile(r'- [✅⏳❌] (Completed|Pending|Failed): (\d+)')
+_STATS_KEYS = {'Completed': 'completed_today', 'Pending': 'pending_today', 'Failed': 'failed_today'}
+
+# Plain YAML scalars the stats fast path can read without PyYAML
+_PLAIN_WORD_RE = re.compile(rb'[A-Za-z_][A-Za-z0-9_-]*')
+_PLAIN_INT_RE = re.compile(rb'0|[1-9][0-9]*')
+_YAML_KEYWORDS = {b'null', b'true', b'false', b'yes', b'no', b'on', b'off', b'y', b'n'}
+
+
+def _parse_stats_fields(block: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Extract the fields used for statistics from a task frontmatter block.
+
+    Handles the flat layout written by TaskFile (top-level scalars plus a
+    `processing:` mapping) and reads only `type` and
+    `processing.duration_seconds`, skipping everything else.
+
+    Args:
+        block: Raw frontmatter bytes between the --- delimiters
+
+    Returns:
+        Metadata dictionary with the stats fields, or None if the block
+        uses YAML features this parser doesn't handle
+    """
+    metadata = {}
+    processing = None
+    child_indent = None
+
+    for line in block.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        # Indented lines belong to the previous top-level key
+        if line[:1] in (b' ', b'\t'):
+            if processing is None:
+                continue
+            indent = len(line) - len(line.lstrip(b' \t'))
+            if child_indent is None:
+                child_indent = indent
+            if indent != child_indent:
+                continue
+            key, sep, value = stripped.partition(b':')
+            if key == b'duration_seconds':
+                value = value.strip()
+                if not _PLAIN_INT_RE.fullmatch(value):
+                    return None
+                processing['duration_seconds'] = int(value)
+            continue
+
+        # Top-level sequence items (e.g. tags) need no handling
+        if stripped.startswith(b'- '):
+            continue
+
+        processing = None
+        child_indent = None
+        key, sep, value = line.partition(b':')
+        if not sep or not _PLAIN_WORD_RE.fullmatch(key):
+            return None
+        value = value.strip()
+
+        if key == b'type':
+            if not _PLAIN_WORD_RE.fullmatch(value) or value.lower() in _YAML_KEYWORDS:
+                return None
+            metadata['type'] = value.decode('ascii')
+        elif key == b'processing':
+            if value:
+                return None
+            processing = metadata['processing'] = {}
+
+    return metadata
+
+
+def _read_task_stats(task_path: str) -> Dict[str, Any]:
+    """
+    Read the frontmatter fields used for statistics from a task file.
+
+    Args:
+        task_path: Path to task file
+
+    Returns:
+        Metadata dictionary (empty if the file has no frontmatter)
+    """
+    block = read_frontmatter_block(task_path)
+    if block is None:
+        return {}
+
+    metadata = _parse_stats_fields(block)
+    if metadata is None:
+        # Fall back to the full YAML parser for anything unusual
+        metadata = parse_frontmatter_only(block.decode('utf-8', errors='replace'))
+    return metadata
+
+
+def _count_md(dir_path: str, prefix: str = '') -> int:
+    """
+    Count markdown files in a folder.
+
+    Args:
+        dir_path: Folder to scan
+        prefix: Only count files whose name starts with this prefix
+
+    Returns:
+        Number of matching files (0 if the folder doesn't exist)
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return sum(
+                1 for entry in it
+                if entry.name.startswith(prefix) and entry.name.endswith('.md')
+                and entry.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        return 0
+
+
+def _list_md(dir_path: str) -> List[os.DirEntry]:
+    """
+    List markdown files in a folder.
+
+    Args:
+        dir_path: Folder to scan
+
+    Returns:
+        Directory entries for matching files (empty if the folder doesn't exist)
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [
+                entry for entry in it
+                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return []
 
 
 class Dashboard:
     """Model for Dashboard.md file."""
 
+    __slots__ = ('vault_path', 'dashboard_path', 'stats', 'recent_activity')
+
+    # Invariant parts of Dashboard.md, rendered once per process
+    _HEADER_TMPL = "# AI Assistant Dashboard\n\n**Last Updated**: %s\n\n## Today's Summary\n\n"
+    _ACTIVITY_TABLE_HEADER = (
+        "\n## Recent Activity\n\n"
+        "| Time | File | Status | Summary |\n"
+        "|------|------|--------|---------|\n"
+    )
+    _NO_ACTIVITY_ROW = "| -- | No activity yet | -- | Drop files in Inbox/ to get started |\n"
+    _QUICK_LINKS = """
+## Quick Links
+
+- [[Company_Handbook]] - Edit processing rules
+- [[Needs_Action/]] - View pending tasks
+- [[Done/]] - View completed tasks
+- [[Logs/]] - View error logs
+"""
+
     def __init__(self, vault_path: str):
         """
         Initialize Dashboard.
@@ -31,25 +194,19 @@ class Dashboard:
             'success_rate': 100.0,
             'most_common_type': 'N/A'
         }
-        self.recent_activity: List[Dict[str, str]] = []
+        self.recent_activity: Deque[Dict[str, str]] = deque(maxlen=10)
 
     def read(self):
         """Read current dashboard state from file."""
-        if not os.path.exists(self.dashboard_path):
+        try:
+            with open(self.dashboard_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
             return
 
-        with open(self.dashboard_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Parse stats from content (simple parsing)
-        lines = content.split('\n')
-        for line in lines:
-            if '✅ Completed:' in line:
-                self.stats['completed_today'] = int(line.split(':')[1].strip().split()[0])
-            elif '⏳ Pending:' in line:
-                self.stats['pending_today'] = int(line.split(':')[1].strip().split()[0])
-            elif '❌ Failed:' in line:
-                self.stats['failed_today'] = int(line.split(':')[1].strip().split()[0])
+        # Parse stats from content in a single pass
+        for match in _STATS_RE.finditer(content):
+            self.stats[_STATS_KEYS[match.group(1)]] = int(match.group(2))
 
     def update_stats(self, vault_path: str):
         """
@@ -58,41 +215,114 @@ class Dashboard:
         Args:
             vault_path: Path to vault root
         """
-        # Count files in folders
         needs_action_path = os.path.join(vault_path, "Needs_Action")
         done_path = os.path.join(vault_path, "Done")
-
-        # Count pending tasks
-        pending_count = 0
-        if os.path.exists(needs_action_path):
-            pending_count = len([f for f in os.listdir(needs_action_path) if f.endswith('.md')])
-
-        # Count completed tasks and gather metadata
-        completed_count = 0
-        completed_tasks = []
-        if os.path.exists(done_path):
-            for filename in os.listdir(done_path):
-                if filename.endswith('.md'):
-                    completed_count += 1
-                    task_path = os.path.join(done_path, filename)
-                    try:
-                        with open(task_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        from src.utils.yaml_handler import parse_frontmatter
-                        metadata, _ = parse_frontmatter(content)
-                        completed_tasks.append(metadata)
-                    except Exception:
-                        pass  # Skip files that can't be parsed
-
+        logs_path = os.path.join(vault_path, "Logs")
+
+        # Directory listings are independent, so scan all three folders at
+        # once; file reads release the GIL, so frontmatter parsing overlaps too
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            pending_future = executor.submit(_count_md, needs_action_path)
+            error_future = executor.submit(_count_md, logs_path, 'error-')
+            completed_entries = executor.submit(_list_md, done_path).result()
+            completed_tasks = self._load_completed_tasks(vault_path, completed_entries, executor)
+            pending_count = pending_future.result()
+            error_count = error_future.result()
+
+        completed_count = len(completed_entries)
         self.stats['pending_today'] = pending_count
         self.stats['completed_today'] = completed_count
         self.stats['total_processed'] = completed_count
 
         # Calculate advanced statistics
         self.stats['avg_time'] = self._calculate_avg_time(completed_tasks)
-        self.stats['success_rate'] = self._calculate_success_rate(vault_path)
+        self.stats['success_rate'] = self._calculate_success_rate(error_count)
         self.stats['most_common_type'] = self._calculate_most_common_type(completed_tasks)
 
+    def _load_completed_tasks(self, vault_path: str, completed_entries: List[os.DirEntry],
+                              executor: ThreadPoolExecutor) -> List[Dict[str, Any]]:
+        """
+        Gather frontmatter metadata for completed task files.
+
+        Args:
+            vault_path: Path to vault root
+            completed_entries: Directory entries for Done/ task files
+            executor: Thread pool used to read changed files
+
+        Returns:
+            List of task metadata dictionaries
+        """
+        # Reuse cached metadata for files whose mtime and size are unchanged
+        cache_path = os.path.join(vault_path, CACHE_FILENAME)
+        cache = self._load_cache(cache_path)
+        new_cache = {}
+        stale = []
+        for entry in completed_entries:
+            st = entry.stat(follow_symlinks=False)
+            cached = cache.get(entry.name)
+            if (cached and cached.get('mtime_ns') == st.st_mtime_ns
+                    and cached.get('size') == st.st_size):
+                new_cache[entry.name] = cached
+            else:
+                stale.append((entry, st))
+
+        futures = {
+            executor.submit(_read_task_stats, entry.path): (entry, st)
+            for entry, st in stale
+        }
+        for future in as_completed(futures):
+            entry, st = futures[future]
+            try:
+                metadata = future.result()
+            except Exception:
+                continue  # Skip files that can't be parsed
+            new_cache[entry.name] = {
+                'mtime_ns': st.st_mtime_ns,
+                'size': st.st_size,
+                'metadata': metadata
+            }
+
+        if stale or len(new_cache) != len(cache):
+            self._save_cache(cache_path, new_cache)
+
+        # Keep directory order so results don't depend on thread scheduling
+        return [
+            new_cache[entry.name].get('metadata') or {}
+            for entry in completed_entries if entry.name in new_cache
+        ]
+
+    def _load_cache(self, cache_path: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the frontmatter cache from disk.
+
+        Args:
+            cache_path: Path to cache file
+
+        Returns:
+            Cache dictionary keyed by task filename
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self, cache_path: str, cache: Dict[str, Dict[str, Any]]):
+        """
+        Save the frontmatter cache to disk.
+
+        Args:
+            cache_path: Path to cache file
+            cache: Cache dictionary keyed by task filename
+        """
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, default=str)
+        except OSError:
+            pass  # Cache is an optimization; stats are still correct without it
+
     def _calculate_avg_time(self, completed_tasks: List[Dict[str, Any]]) -> int:
         """
         Calculate average processing time from completed tasks.
@@ -110,30 +340,26 @@ class Dashboard:
         count = 0
 
         for task in completed_tasks:
-            if 'processing' in task and 'duration_seconds' in task['processing']:
-                total_time += task['processing']['duration_seconds']
+            processing = task.get('processing')
+            if isinstance(processing, dict) and 'duration_seconds' in processing:
+                total_time += processing['duration_seconds']
                 count += 1
 
         return int(total_time / count) if count > 0 else 0
 
-    def _calculate_success_rate(self, vault_path: str) -> float:
+    def _calculate_success_rate(self, error_count: int) -> float:
         """
         Calculate success rate based on completed vs failed tasks.
 
         Args:
-            vault_path: Path to vault root
+            error_count: Number of error-*.md files in the Logs folder
 
         Returns:
             Success rate as percentage
         """
         completed = self.stats['completed_today']
-        failed = self.stats['failed_today']
-
-        # Also check for failed files in Logs folder
-        logs_path = os.path.join(vault_path, 'Logs')
-        if os.path.exists(logs_path):
-            error_files = [f for f in os.listdir(logs_path) if f.startswith('error-') and f.endswith('.md')]
-            failed += len(error_files)
+        # Failed files in Logs folder count as failures too
+        failed = self.stats['failed_today'] + error_count
 
         total = completed + failed
         if total == 0:
@@ -151,21 +377,22 @@ class Dashboard:
         Returns:
             Most common task type or 'N/A'
         """
-        if not completed_tasks:
-            return 'N/A'
-
-        types = []
+        # Count and track the leader in one pass
+        counts = {}
+        most_common = None
+        most_common_count = 0
         for task in completed_tasks:
-            if 'type' in task:
-                types.append(task['type'])
-
-        if not types:
+            task_type = task.get('type')
+            if not task_type:
+                continue
+            count = counts[task_type] = counts.get(task_type, 0) + 1
+            if count > most_common_count:
+                most_common = task_type
+                most_common_count = count
+
+        if most_common is None:
             return 'N/A'
 
-        # Use Counter to find most common
-        type_counts = Counter(types)
-        most_common = type_counts.most_common(1)[0][0]
-
         # Format nicely
         return most_common.replace('_', ' ').title()
 
@@ -191,55 +418,71 @@ class Dashboard:
             'summary': summary[:50]  # Truncate to 50 chars
         }
 
-        self.recent_activity.insert(0, activity)
-
-        # Keep only last 10
-        self.recent_activity = self.recent_activity[:10]
+        # Newest first; the deque drops the oldest beyond 10 entries
+        self.recent_activity.appendleft(activity)
 
     def write(self):
         """Write dashboard to file."""
+        stats = self.stats
+        parts = [
+            self._HEADER_TMPL % datetime.now(timezone.utc).isoformat(),
+            f"- ✅ Completed: {stats['completed_today']} tasks\n"
+            f"- ⏳ Pending: {stats['pending_today']} tasks\n"
+            f"- ❌ Failed: {stats['failed_today']} tasks\n",
+            self._ACTIVITY_TABLE_HEADER,
+        ]
+
         # Build recent activity table
-        activity_rows = []
         if self.recent_activity:
             for activity in self.recent_activity:
-                row = f"| {activity['time']} | [[{activity['task_id']}|{activity['display_name']}]] | {activity['status']} | {activity['summary']} |"
-                activity_rows.append(row)
+                parts.append(f"| {activity['time']} | [[{activity['task_id']}|{activity['display_name']}]] | {activity['status']} | {activity['summary']} |\n")
         else:
-            activity_rows.append("| -- | No activity yet | -- | Drop files in Inbox/ to get started |")
-
-        content = f"""# AI Assistant Dashboard
-
-**Last Updated**: {datetime.now(timezone.utc).isoformat()}
-
-## Today's Summary
-
-- ✅ Completed: {self.stats['completed_today']} tasks
-- ⏳ Pending: {self.stats['pending_today']} tasks
-- ❌ Failed: {self.stats['failed_today']} tasks
-
-## Recent Activity
-
-| Time | File | Status | Summary |
-|------|------|--------|---------|
-{chr(10).join(activity_rows)}
-
-## Statistics
-
-- **Total tasks processed**: {self.stats['total_processed']}
-- **Average processing time**: {self.stats['avg_time']}s
-- **Success rate**: {self.stats['success_rate']:.1f}%
-- **Most common type**: {self.stats['most_common_type']}
+            parts.append(self._NO_ACTIVITY_ROW)
+
+        parts.append(
+            "\n## Statistics\n\n"
+            f"- **Total tasks processed**: {stats['total_processed']}\n"
+            f"- **Average processing time**: {stats['avg_time']}s\n"
+            f"- **Success rate**: {stats['success_rate']:.1f}%\n"
+            f"- **Most common type**: {stats['most_common_type']}\n"
+        )
+        parts.append(self._QUICK_LINKS)
+
+        # Write to a temp file and swap it in, so a crash never leaves a
+        # truncated dashboard behind. O_BINARY (Windows only) stops os.write
+        # from translating newlines, as tempfile does.
+        data = memoryview("".join(parts).encode('utf-8'))
+        tmp_path = self.dashboard_path + '.tmp'
+        flags = os.O_CREAT | os.O_WRONLY | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(tmp_path, flags, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.dashboard_path)
+
+    def apply_updates(self, outcomes: List[Tuple[bool, Optional[Dict[str, str]]]]):
+        """
+        Apply a batch of task outcomes and recalculate stats once.
 
-## Quick Links
+        Args:
+            outcomes: (succeeded, activity) pairs in completion order, where
+                activity holds the add_activity keyword arguments, or None
+                to only count the task
+        """
+        self.read()
 
-- [[Company_Handbook]] - Edit processing rules
-- [[Needs_Action/]] - View pending tasks
-- [[Done/]] - View completed tasks
-- [[Logs/]] - View error logs
-"""
+        for succeeded, activity in outcomes:
+            if succeeded:
+                self.increment_completed()
+            else:
+                self.increment_failed()
+            if activity is not None:
+                self.add_activity(**activity)
 
-        with open(self.dashboard_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self.update_stats(self.vault_path)
 
     def increment_completed(self):
         """Increment completed count."""
@@ -6,12 +6,105 @@ Manages the Company_Handbook.md file with user-defined processing rules.
 
 import os
 import re
-from typing import Dict, List, Any
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+# Patterns are compiled once at import time and shared by every Handbook.
+# Handbook structure is ASCII, so section parsing runs on raw bytes and only
+# the extracted values are decoded.
+_SECTION_HEADERS = (
+    '### Summarization',
+    '### Tone & Style',
+    '### Special Instructions',
+    '## Custom Flags',
+)
+_SECTION_RES = {
+    header: re.compile(re.escape(header.encode()) + rb"(.*?)(?=###|##|$)", re.DOTALL)
+    for header in _SECTION_HEADERS
+}
+_PREFERENCES_SECTION_RE = re.compile(rb"## Preferences(.*?)(?=##|$)", re.DOTALL)
+_PREF_RE = re.compile(rb'- \*\*(.+?)\*\*:\s*(.+)')
+_AMOUNT_RE = re.compile(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)')
+_DAYS_RE = re.compile(r'(\d+)\s*days?')
+_MONTHS = 'January|February|March|April|May|June|July|August|September|October|November|December'
+_DATE_RE = re.compile(
+    r'(?P<iso>\d{4}-\d{2}-\d{2})'  # ISO format
+    r'|(?P<us>\d{1,2}/\d{1,2}/\d{4})'  # MM/DD/YYYY
+    rf'|(?P<long>(?:{_MONTHS})\s+\d{{1,2}},?\s+\d{{4}})',  # Month DD, YYYY
+    re.IGNORECASE
+)
+
+# (lowest, highest, distinct values) of the numbers found in content
+ValueSummary = Tuple[Optional[float], Optional[float], frozenset]
+
+# Flag checks take (amounts, keywords_found, date_offsets) from one content scan
+FlagCheck = Callable[[ValueSummary, set, ValueSummary], bool]
+
+_NO_VALUES: ValueSummary = (None, None, frozenset())
+
+
+def _parse_operator(condition: str) -> Optional[str]:
+    """
+    Get the comparison operator used in a flag condition.
+
+    Args:
+        condition: Condition string (e.g., "Amount > $500")
+
+    Returns:
+        '>', '<', '=' or None if the condition has no operator
+    """
+    if '>' in condition:
+        return '>'
+    if '<' in condition:
+        return '<'
+    if '=' in condition:
+        return '='
+    return None
+
+
+def _summarize(values: List[float]) -> ValueSummary:
+    """
+    Reduce the numbers found in content to what threshold checks need.
+
+    Args:
+        values: Numbers found in content
+
+    Returns:
+        (lowest, highest, distinct values); (None, None, empty) if none
+    """
+    if not values:
+        return _NO_VALUES
+    return min(values), max(values), frozenset(values)
+
+
+def _threshold_check(operator: Optional[str], threshold: float) -> Callable[[ValueSummary], bool]:
+    """
+    Build a check that any value found in content meets a flag threshold.
+
+    Each check is O(1) against the summary, however many values were found.
+
+    Args:
+        operator: '>', '<', '=' or None (no operator matches any value)
+        threshold: Threshold from the flag condition
+
+    Returns:
+        Function taking the summary of values found in content
+    """
+    if operator == '>':
+        return lambda summary: summary[1] is not None and summary[1] > threshold
+    if operator == '<':
+        return lambda summary: summary[0] is not None and summary[0] < threshold
+    if operator == '=':
+        return lambda summary: threshold in summary[2]
+    return lambda summary: bool(summary[2])
 
 
 class Handbook:
     """Model for Company_Handbook.md file."""
 
+    __slots__ = ('vault_path', 'handbook_path', 'rules', '_compiled_flags', '_keyword_re',
+                 '_uses_amounts', '_uses_dates', '_cached_stat')
+
     def __init__(self, vault_path: str):
         """
         Initialize Handbook.
@@ -28,18 +121,33 @@ class Handbook:
             'custom_flags': [],
             'preferences': {}
         }
+        self._compiled_flags: List[Tuple[FlagCheck, str]] = []
+        self._keyword_re = None
+        self._uses_amounts = False
+        self._uses_dates = False
+        self._cached_stat = None
 
     def read(self) -> Dict[str, Any]:
         """
         Read and parse handbook rules.
 
+        The parsed rules are cached and only re-parsed when the handbook's
+        modification time or size changes.
+
         Returns:
             Dictionary of parsed rules
         """
-        if not os.path.exists(self.handbook_path):
+        try:
+            st = os.stat(self.handbook_path)
+        except FileNotFoundError:
+            self._cached_stat = None
             return self._get_default_rules()
 
-        with open(self.handbook_path, 'r', encoding='utf-8') as f:
+        file_stat = (st.st_mtime_ns, st.st_size)
+        if file_stat == self._cached_stat:
+            return self.rules
+
+        with open(self.handbook_path, 'rb') as f:
             content = f.read()
 
         # Parse sections
@@ -48,23 +156,27 @@ class Handbook:
         self.rules['special_instructions'] = self._extract_section(content, '### Special Instructions')
         self.rules['custom_flags'] = self._extract_section(content, '## Custom Flags')
         self.rules['preferences'] = self._extract_preferences(content)
+        self._compile_flags_from_rules()
+        self._cached_stat = file_stat
 
         return self.rules
 
-    def _extract_section(self, content: str, section_header: str) -> List[str]:
+    def _extract_section(self, content: bytes, section_header: str) -> List[str]:
         """
         Extract bullet points from a section.
 
         Args:
-            content: Full handbook content
+            content: Full handbook content (UTF-8 bytes)
             section_header: Section header to find
 
         Returns:
             List of rules/items in that section
         """
         # Find section
-        pattern = f"{re.escape(section_header)}(.*?)(?=###|##|$)"
-        match = re.search(pattern, content, re.DOTALL)
+        section_re = _SECTION_RES.get(section_header)
+        if section_re is None:
+            section_re = re.compile(re.escape(section_header.encode()) + rb"(.*?)(?=###|##|$)", re.DOTALL)
+        match = section_re.search(content)
 
         if not match:
             return []
@@ -73,27 +185,26 @@ class Handbook:
 
         # Extract bullet points
         rules = []
-        for line in section_content.split('\n'):
+        for line in section_content.split(b'\n'):
             line = line.strip()
-            if line.startswith('- '):
-                rules.append(line[2:])  # Remove "- " prefix
+            if line.startswith(b'- '):
+                rules.append(line[2:].decode('utf-8'))  # Remove "- " prefix
 
         return rules
 
-    def _extract_preferences(self, content: str) -> Dict[str, str]:
+    def _extract_preferences(self, content: bytes) -> Dict[str, str]:
         """
         Extract preferences from Preferences section.
 
         Args:
-            content: Full handbook content
+            content: Full handbook content (UTF-8 bytes)
 
         Returns:
             Dictionary of preferences
         """
         preferences = {}
 
-        pattern = r"## Preferences(.*?)(?=##|$)"
-        match = re.search(pattern, content, re.DOTALL)
+        match = _PREFERENCES_SECTION_RE.search(content)
 
         if not match:
             return preferences
@@ -101,14 +212,14 @@ class Handbook:
         pref_content = match.group(1)
 
         # Extract key-value pairs
-        for line in pref_content.split('\n'):
+        for line in pref_content.split(b'\n'):
             line = line.strip()
-            if line.startswith('- **') and '**:' in line:
+            if line.startswith(b'- **') and b'**:' in line:
                 # Format: - **Key**: Value
-                key_match = re.match(r'- \*\*(.+?)\*\*:\s*(.+)', line)
+                key_match = _PREF_RE.match(line)
                 if key_match:
-                    key = key_match.group(1).lower().replace(' ', '_')
-                    value = key_match.group(2)
+                    key = key_match.group(1).decode('utf-8').lower().replace(' ', '_')
+                    value = key_match.group(2).decode('utf-8')
                     preferences[key] = value
 
         return preferences
@@ -152,38 +263,38 @@ class Handbook:
         """
         rules = self.read()
 
-        context = "# Processing Rules\n\n"
+        parts = ["# Processing Rules\n\n"]
 
         if rules['summarization']:
-            context += "## Summarization:\n"
+            parts.append("## Summarization:\n")
             for rule in rules['summarization']:
-                context += f"- {rule}\n"
-            context += "\n"
+                parts.append(f"- {rule}\n")
+            parts.append("\n")
 
         if rules['tone_style']:
-            context += "## Tone & Style:\n"
+            parts.append("## Tone & Style:\n")
             for rule in rules['tone_style']:
-                context += f"- {rule}\n"
-            context += "\n"
+                parts.append(f"- {rule}\n")
+            parts.append("\n")
 
         if rules['special_instructions']:
-            context += "## Special Instructions:\n"
+            parts.append("## Special Instructions:\n")
             for rule in rules['special_instructions']:
-                context += f"- {rule}\n"
-            context += "\n"
+                parts.append(f"- {rule}\n")
+            parts.append("\n")
 
         if rules['custom_flags']:
-            context += "## Custom Flags:\n"
+            parts.append("## Custom Flags:\n")
             for flag in rules['custom_flags']:
-                context += f"- {flag}\n"
-            context += "\n"
+                parts.append(f"- {flag}\n")
+            parts.append("\n")
 
         if rules['preferences']:
-            context += "## Preferences:\n"
+            parts.append("## Preferences:\n")
             for key, value in rules['preferences'].items():
-                context += f"- {key.replace('_', ' ').title()}: {value}\n"
+                parts.append(f"- {key.replace('_', ' ').title()}: {value}\n")
 
-        return context
+        return "".join(parts)
 
     def parse_custom_flags(self) -> List[Dict[str, str]]:
         """
@@ -210,127 +321,131 @@ class Handbook:
         """
         Detect and apply custom flags based on content.
 
+        Content is scanned at most once per condition type (amounts,
+        keywords, dates), however many flags the handbook defines.
+
         Args:
             content: Original content to analyze
 
         Returns:
             List of flags that apply to this content
         """
-        applied_flags = []
-        flags = self.parse_custom_flags()
-
-        for flag_def in flags:
-            condition = flag_def['condition']
-            flag = flag_def['flag']
-
-            # Parse condition (e.g., "Amount > $500")
-            if self._check_condition(condition, content):
-                applied_flags.append(flag)
+        if not self._compiled_flags:
+            return []
 
-        return applied_flags
+        amounts = _NO_VALUES
+        if self._uses_amounts:
+            amounts = _summarize([float(a.replace(',', '')) for a in _AMOUNT_RE.findall(content)])
+        keywords_found = self._find_keywords(content)
+        date_offsets = _NO_VALUES
+        if self._uses_dates:
+            date_offsets = _summarize(self._find_date_offsets(content))
+
+        return [
+            flag for check, flag in self._compiled_flags
+            if check(amounts, keywords_found, date_offsets)
+        ]
 
-    def _check_condition(self, condition: str, content: str) -> bool:
+    def _compile_flags_from_rules(self):
         """
-        Check if a condition matches the content.
-
-        Args:
-            condition: Condition string (e.g., "Amount > $500")
-            content: Content to check
+        Compile custom flag conditions into checks over a single content scan.
 
-        Returns:
-            True if condition matches
+        Supported conditions are amounts (e.g. "Amount > $500"), keywords
+        (e.g. "Contains 'urgent'") and dates (e.g. "Due date < 7 days").
+        Conditions that can never match are dropped here.
         """
-        # Handle amount conditions (e.g., "Amount > $500")
-        if 'Amount' in condition or '$' in condition:
-            return self._check_amount_condition(condition, content)
-
-        # Handle keyword conditions (e.g., "Contains 'urgent'")
-        if 'Contains' in condition or 'contains' in condition:
-            keyword = condition.split("'")[1] if "'" in condition else ""
-            return keyword.lower() in content.lower()
+        self._compiled_flags = []
+        self._uses_amounts = False
+        self._uses_dates = False
+        keywords = set()
 
-        # Handle date conditions (e.g., "Due date < 7 days")
-        if 'Due date' in condition or 'due date' in condition:
-            return self._check_date_condition(condition, content)
-
-        return False
+        for flag_def in self.parse_custom_flags():
+            condition = flag_def['condition']
+            flag = flag_def['flag']
 
-    def _check_amount_condition(self, condition: str, content: str) -> bool:
+            if 'Amount' in condition or '$' in condition:
+                threshold_match = _AMOUNT_RE.search(condition)
+                if not threshold_match:
+                    continue
+                operator = _parse_operator(condition)
+                if operator is None:
+                    continue
+                threshold = float(threshold_match.group(1).replace(',', ''))
+                amount_check = _threshold_check(operator, threshold)
+                check = lambda amounts, _keywords, _dates, amount_check=amount_check: amount_check(amounts)
+                self._uses_amounts = True
+
+            elif 'Contains' in condition or 'contains' in condition:
+                keyword = condition.split("'")[1].lower() if "'" in condition else ""
+                keywords.add(keyword)
+                # A keyword found at a position also covers its prefixes there
+                check = lambda _amounts, found, _dates, keyword=keyword: any(
+                    match.startswith(keyword) for match in found
+                )
+
+            elif 'Due date' in condition or 'due date' in condition:
+                days_match = _DAYS_RE.search(condition)
+                if not days_match:
+                    continue
+                date_check = _threshold_check(_parse_operator(condition), int(days_match.group(1)))
+                check = lambda _amounts, _keywords, dates, date_check=date_check: date_check(dates)
+                self._uses_dates = True
+
+            else:
+                continue
+
+            self._compiled_flags.append((check, flag))
+
+        # Zero-width lookahead so overlapping keywords are all reported;
+        # longest alternatives first so prefixes are implied by the match.
+        # IGNORECASE lets the scan run over the content as-is, without
+        # materializing a lowercased copy of every task.
+        keywords.discard("")
+        if keywords:
+            alternation = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+            self._keyword_re = re.compile(f"(?=({alternation}))", re.IGNORECASE)
+        else:
+            self._keyword_re = None
+
+    def _find_date_offsets(self, content: str) -> List[int]:
         """
-        Check if amount condition matches content.
+        Find every date in content in a single pass.
 
         Args:
-            condition: Amount condition (e.g., "Amount > $500")
-            content: Content to check
+            content: Content to scan
 
         Returns:
-            True if condition matches
+            Days from today (UTC) to each date found; negative for past dates
         """
-        import re
-
-        # Extract threshold from condition
-        threshold_match = re.search(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)', condition)
-        if not threshold_match:
-            return False
-
-        threshold = float(threshold_match.group(1).replace(',', ''))
-
-        # Find all amounts in content
-        amount_pattern = r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)'
-        amounts = re.findall(amount_pattern, content)
-
-        if not amounts:
-            return False
-
-        # Check if any amount meets condition
-        for amount_str in amounts:
-            amount = float(amount_str.replace(',', ''))
-
-            if '>' in condition:
-                if amount > threshold:
-                    return True
-            elif '<' in condition:
-                if amount < threshold:
-                    return True
-            elif '=' in condition or '==' in condition:
-                if amount == threshold:
-                    return True
-
-        return False
-
-    def _check_date_condition(self, condition: str, content: str) -> bool:
+        today = datetime.now(timezone.utc).date()
+        offsets = []
+
+        for match in _DATE_RE.finditer(content):
+            try:
+                if match.group('iso'):
+                    date = datetime.strptime(match.group('iso'), '%Y-%m-%d')
+                elif match.group('us'):
+                    date = datetime.strptime(match.group('us'), '%m/%d/%Y')
+                else:
+                    text = ' '.join(match.group('long').replace(',', ' ').split())
+                    date = datetime.strptime(text, '%B %d %Y')
+            except ValueError:
+                continue  # Looks like a date but isn't one (e.g. 2024-13-45)
+            offsets.append((date.date() - today).days)
+
+        return offsets
+
+    def _find_keywords(self, content: str) -> set:
         """
-        Check if date condition matches content.
+        Find every flag keyword present in content in a single pass.
 
         Args:
-            condition: Date condition (e.g., "Due date < 7 days")
-            content: Content to check
+            content: Content to scan
 
         Returns:
-            True if condition matches
+            Set of matched keywords (lowercase); always contains ""
         """
-        import re
-        from datetime import datetime, timedelta
-
-        # Extract days threshold
-        days_match = re.search(r'(\d+)\s*days?', condition)
-        if not days_match:
-            return False
-
-        threshold_days = int(days_match.group(1))
-
-        # Look for date patterns in content
-        date_patterns = [
-            r'(\d{4}-\d{2}-\d{2})',  # ISO format
-            r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}'
-        ]
-
-        for pattern in date_patterns:
-            dates = re.findall(pattern, content, re.IGNORECASE)
-            if dates:
-                # Found dates - check if within threshold
-                # This is a simplified check
-                return True
-
-        return False
+        found = {""}
+        if self._keyword_re is not None:
+            found.update(m.group(1).lower() for m in self._keyword_re.finditer(content))
+        return found
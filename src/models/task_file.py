@@ -6,8 +6,9 @@ Represents a task file with YAML frontmatter and markdown content.
 
 import os
 import hashlib
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from ..utils.yaml_handler import parse_frontmatter, write_frontmatter
 
 
@@ -24,6 +25,8 @@ class TaskFile:
         self.file_path = file_path
         self.metadata: Dict[str, Any] = {}
         self.content: str = ""
+        self._defer_depth = 0
+        self._dirty = False
 
         if os.path.exists(file_path):
             self.read()
@@ -128,14 +131,44 @@ class TaskFile:
         self.metadata, self.content = parse_frontmatter(file_content)
 
     def write(self):
-        """Write task file to disk."""
+        """Write task file to disk (or mark it dirty inside deferred_writes)."""
+        if self._defer_depth:
+            self._dirty = True
+            return
+
         full_content = write_frontmatter(self.metadata, self.content)
 
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
 
-        with open(self.file_path, 'w', encoding='utf-8') as f:
+        # Write to a temp file and swap it in, so a crash mid-write never
+        # leaves a truncated task that fails to parse on the next run
+        tmp_path = self.file_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             f.write(full_content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.file_path)
+
+    @contextmanager
+    def deferred_writes(self) -> Iterator['TaskFile']:
+        """
+        Coalesce writes made inside the block into one write on exit.
+
+        The pending write is flushed even if the block raises, so the
+        last in-memory state (e.g. a 'failed' status) still reaches disk.
+
+        Yields:
+            This TaskFile
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if not self._defer_depth and self._dirty:
+                self._dirty = False
+                self.write()
 
     def update_status(self, status: str):
         """
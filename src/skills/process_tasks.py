@@ -6,8 +6,10 @@ Handles AI-powered task processing with Claude API.
 
 import os
 import sys
+import errno
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -17,6 +19,10 @@ from src.models.dashboard import Dashboard
 from src.models.handbook import Handbook
 from src.utils.logger import setup_logger
 
+ORIGINAL_CONTENT_HEADER = '## Original Content'
+AI_ANALYSIS_HEADER = '## AI Analysis'
+ANALYSIS_PLACEHOLDER = '[To be generated by AI processing]'
+
 
 class TaskProcessor:
     """Processes pending tasks with AI analysis."""
@@ -29,7 +35,10 @@ class TaskProcessor:
             vault_path: Path to vault root
         """
         self.vault_path = vault_path
-        self.logger = setup_logger('task_processor', os.path.join(vault_path, 'Logs'))
+        self.needs_action_path = os.path.join(vault_path, 'Needs_Action')
+        self.logs_path = os.path.join(vault_path, 'Logs')
+        self.failed_path = os.path.join(self.logs_path, 'failed')
+        self.logger = setup_logger('task_processor', self.logs_path)
         self.handbook = Handbook(vault_path)
         self.dashboard = Dashboard(vault_path)
 
@@ -37,18 +46,23 @@ class TaskProcessor:
         """
         Get list of pending task files.
 
+        Largest files come first, so the thread pool starts the slowest
+        tasks early instead of leaving one running alone at the end.
+
         Returns:
             List of task file paths
         """
-        needs_action_path = os.path.join(self.vault_path, 'Needs_Action')
-        task_files = []
-
-        if os.path.exists(needs_action_path):
-            for filename in os.listdir(needs_action_path):
-                if filename.endswith('.md'):
-                    task_files.append(os.path.join(needs_action_path, filename))
+        try:
+            with os.scandir(self.needs_action_path) as entries:
+                task_entries = [entry for entry in entries
+                                if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)]
+        except FileNotFoundError:
+            return []
 
-        return task_files
+        # DirEntry.stat() costs one lstat per entry on Linux (only Windows
+        # gets it free from the listing); cheap next to processing a task.
+        task_entries.sort(key=lambda entry: entry.stat(follow_symlinks=False).st_size, reverse=True)
+        return [entry.path for entry in task_entries]
 
     def process_all_tasks(self) -> Dict[str, int]:
         """
@@ -71,27 +85,77 @@ class TaskProcessor:
 
         success_count = 0
         failed_count = 0
-
-        for task_path in task_files:
-            task = None
-            try:
-                self.logger.info(f"Processing: {os.path.basename(task_path)}")
-
-                # Validate task file exists
-                if not os.path.exists(task_path):
-                    self.logger.error(f"Task file not found: {task_path}")
+        outcomes = []
+
+        # Tasks are independent and I/O-bound, so process them in a thread
+        # pool; dashboard updates are collected here and applied in one batch
+        max_workers = min(len(task_files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._process_one, task_path, handbook_context)
+                for task_path in task_files
+            ]
+            for future in as_completed(futures):
+                succeeded, task = future.result()
+                if succeeded:
+                    success_count += 1
+                else:
                     failed_count += 1
-                    continue
+                if task is None:
+                    continue  # Nothing to record on the dashboard
 
-                # Load task with validation
+                # A task whose metadata can't describe it still counts
+                activity = None
                 try:
-                    task = TaskFile(task_path)
+                    activity = self._build_activity(task, succeeded)
                 except Exception as e:
-                    self.logger.error(f"Failed to load task file {task_path}: {e}")
-                    self._handle_corrupted_task(task_path, e)
-                    failed_count += 1
-                    continue
+                    self.logger.error(f"Failed to build dashboard activity: {e}")
+                    # Don't fail the task if dashboard update fails
+                outcomes.append((succeeded, activity))
+
+        # Update and save dashboard once for the whole run
+        try:
+            self.dashboard.apply_updates(outcomes)
+        except Exception as e:
+            self.logger.error(f"Failed to update dashboard: {e}")
+        self.dashboard.write()
+
+        self.logger.info(f"Processing complete: {success_count} succeeded, {failed_count} failed")
+        return {'success': success_count, 'failed': failed_count}
 
+    def _process_one(self, task_path: str, handbook_context: str) -> Tuple[bool, Optional[TaskFile]]:
+        """
+        Process a single pending task.
+
+        Runs in a worker thread, so it must not touch the dashboard.
+
+        Args:
+            task_path: Path to task file
+            handbook_context: Handbook rules context
+
+        Returns:
+            Tuple of (succeeded, task); task is None when there is nothing
+            to record on the dashboard
+        """
+        task = None
+        try:
+            self.logger.info(f"Processing: {os.path.basename(task_path)}")
+
+            # Validate task file exists
+            if not os.path.exists(task_path):
+                self.logger.error(f"Task file not found: {task_path}")
+                return False, None
+
+            # Load task with validation
+            try:
+                task = TaskFile(task_path)
+            except Exception as e:
+                self.logger.error(f"Failed to load task file {task_path}: {e}")
+                self._handle_corrupted_task(task_path, e)
+                return False, None
+
+            # Status updates and the analysis share a single write
+            with task.deferred_writes():
                 # Update status to processing
                 task.update_status('processing')
 
@@ -104,56 +168,42 @@ class TaskProcessor:
                     task.update_status('failed')
                     task.metadata['error'] = str(e)
                     task.write()
-                    self._update_dashboard_failed(task)
-                    failed_count += 1
-                    continue
+                    return False, task
 
                 # Update status to completed
                 task.update_status('completed')
 
-                # Move to Done with error handling
-                try:
-                    task.move_to_done(self.vault_path)
-                except Exception as e:
-                    self.logger.error(f"Failed to move task to Done: {e}")
-                    # Task is processed but couldn't be moved - log but count as success
-                    self.logger.warning(f"Task {task.metadata['id']} processed but not moved to Done/")
+            # Move to Done with error handling
+            try:
+                task.move_to_done(self.vault_path)
+            except Exception as e:
+                self.logger.error(f"Failed to move task to Done: {e}")
+                # Task is processed but couldn't be moved - log but count as success
+                self.logger.warning(f"Task {task.metadata['id']} processed but not moved to Done/")
 
-                # Update dashboard
-                try:
-                    self._update_dashboard(task)
-                except Exception as e:
-                    self.logger.error(f"Failed to update dashboard: {e}")
-                    # Don't fail the task if dashboard update fails
+            self.logger.info(f"Completed: {task.metadata['id']}")
+            return True, task
 
-                success_count += 1
-                self.logger.info(f"Completed: {task.metadata['id']}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error processing {task_path}: {e}")
+            from src.utils.logger import create_error_log
+            create_error_log(
+                self.logs_path,
+                e,
+                f"Unexpected error processing task: {task_path}"
+            )
 
-            except Exception as e:
-                failed_count += 1
-                self.logger.error(f"Unexpected error processing {task_path}: {e}")
-                from src.utils.logger import create_error_log
-                create_error_log(
-                    os.path.join(self.vault_path, 'Logs'),
-                    e,
-                    f"Unexpected error processing task: {task_path}"
-                )
-
-                # Try to mark task as failed if we have task object
-                if task:
-                    try:
-                        task.update_status('failed')
-                        task.metadata['error'] = str(e)
-                        task.write()
-                        self._update_dashboard_failed(task)
-                    except:
-                        pass  # Best effort
-
-        # Save dashboard
-        self.dashboard.write()
+            # Try to mark task as failed if we have task object
+            if task:
+                try:
+                    task.update_status('failed')
+                    task.metadata['error'] = str(e)
+                    task.write()
+                    return False, task
+                except:
+                    pass  # Best effort
 
-        self.logger.info(f"Processing complete: {success_count} succeeded, {failed_count} failed")
-        return {'success': success_count, 'failed': failed_count}
+            return False, None
 
     def _add_ai_analysis(self, task: TaskFile, handbook_context: str):
         """
@@ -163,8 +213,17 @@ class TaskProcessor:
             task: TaskFile instance
             handbook_context: Handbook rules context
         """
-        # Extract original content
-        original_content = task.content.split('## Original Content')[1].split('## AI Analysis')[0].strip()
+        content = task.content
+
+        # Extract original content by slicing between the section headers
+        header = content.find(ORIGINAL_CONTENT_HEADER)
+        if header == -1:
+            raise ValueError(f"Task has no '{ORIGINAL_CONTENT_HEADER}' section")
+        start = header + len(ORIGINAL_CONTENT_HEADER)
+        end = content.find(AI_ANALYSIS_HEADER, start)
+        if end == -1:
+            end = len(content)
+        original_content = content[start:end].strip()
 
         # Apply custom flags from handbook
         custom_flags = self.handbook.apply_custom_flags(original_content)
@@ -177,11 +236,11 @@ class TaskProcessor:
         # Generate summary (placeholder - in real implementation, this would call Claude API)
         summary = self._generate_summary(original_content, handbook_context, custom_flags)
 
-        # Update task content
-        task.content = task.content.replace(
-            '[To be generated by AI processing]',
-            summary
-        )
+        # Update task content; the placeholder lives after the original content
+        placeholder = content.find(ANALYSIS_PLACEHOLDER, end)
+        if placeholder != -1:
+            task.content = (content[:placeholder] + summary
+                            + content[placeholder + len(ANALYSIS_PLACEHOLDER):])
 
         # Add processing metadata
         task.add_processing_metadata(
@@ -231,29 +290,34 @@ class TaskProcessor:
 """
         return summary
 
-    def _update_dashboard(self, task: TaskFile):
+    def _build_activity(self, task: TaskFile, succeeded: bool) -> Dict[str, str]:
         """
-        Update dashboard with completed task.
+        Build the dashboard activity entry for a processed task.
 
         Args:
-            task: Completed TaskFile instance
-        """
-        self.dashboard.read()
-        self.dashboard.increment_completed()
-
-        # Add to recent activity
-        display_name = task.metadata['original_file']['name']
-        summary = "Task completed successfully"
-
-        self.dashboard.add_activity(
-            task_id=task.metadata['id'],
-            display_name=display_name,
-            status='✅',
-            summary=summary
-        )
+            task: Processed TaskFile instance
+            succeeded: Whether processing completed
 
-        # Update stats
-        self.dashboard.update_stats(self.vault_path)
+        Returns:
+            Keyword arguments for Dashboard.add_activity
+        """
+        if succeeded:
+            return {
+                'task_id': task.metadata['id'],
+                'display_name': task.metadata['original_file']['name'],
+                'status': '✅',
+                'summary': "Task completed successfully"
+            }
+
+        display_name = task.metadata.get('original_file', {}).get('name', 'Unknown')
+        error_msg = task.metadata.get('error', 'Processing failed')
+
+        return {
+            'task_id': task.metadata['id'],
+            'display_name': display_name,
+            'status': '❌',
+            'summary': f"Failed: {error_msg[:30]}"
+        }
 
     def _handle_corrupted_task(self, task_path: str, error: Exception):
         """
@@ -263,17 +327,20 @@ class TaskProcessor:
             task_path: Path to corrupted task file
             error: Exception that occurred
         """
-        import shutil
-
         # Create failed folder if it doesn't exist
-        failed_path = os.path.join(self.vault_path, 'Logs', 'failed')
-        os.makedirs(failed_path, exist_ok=True)
+        os.makedirs(self.failed_path, exist_ok=True)
 
         # Move corrupted file to failed folder
         try:
-            filename = os.path.basename(task_path)
-            dest_path = os.path.join(failed_path, filename)
-            shutil.move(task_path, dest_path)
+            dest_path = f"{self.failed_path}{os.sep}{os.path.basename(task_path)}"
+            try:
+                # Same filesystem in practice: a single rename syscall
+                os.replace(task_path, dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                import shutil
+                shutil.move(task_path, dest_path)
             self.logger.info(f"Moved corrupted task to: {dest_path}")
         except Exception as e:
             self.logger.error(f"Failed to move corrupted task: {e}")
@@ -281,38 +348,11 @@ class TaskProcessor:
         # Create error log
         from src.utils.logger import create_error_log
         create_error_log(
-            os.path.join(self.vault_path, 'Logs'),
+            self.logs_path,
             error,
             f"Corrupted task file: {task_path}"
         )
 
-    def _update_dashboard_failed(self, task: TaskFile):
-        """
-        Update dashboard with failed task.
-
-        Args:
-            task: Failed TaskFile instance
-        """
-        try:
-            self.dashboard.read()
-            self.dashboard.increment_failed()
-
-            # Add to recent activity
-            display_name = task.metadata.get('original_file', {}).get('name', 'Unknown')
-            error_msg = task.metadata.get('error', 'Processing failed')
-
-            self.dashboard.add_activity(
-                task_id=task.metadata['id'],
-                display_name=display_name,
-                status='❌',
-                summary=f"Failed: {error_msg[:30]}"
-            )
-
-            # Update stats
-            self.dashboard.update_stats(self.vault_path)
-        except Exception as e:
-            self.logger.error(f"Failed to update dashboard for failed task: {e}")
-
 
 def main():
     """Main entry point for task processing."""
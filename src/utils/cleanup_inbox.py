@@ -8,14 +8,24 @@ successfully processed and moved to Done folder.
 import os
 import sys
 import json
+import sqlite3
 import argparse
 from pathlib import Path
 from datetime import datetime, timezone
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from src.utils.logger import setup_logger
+from src.utils.yaml_handler import read_frontmatter
+
+# orjson is optional; stdlib json also accepts bytes, just more slowly
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class InboxCleaner:
@@ -32,13 +42,14 @@ class InboxCleaner:
         self.vault_path = Path(vault_path)
         self.inbox_path = self.vault_path / 'Inbox'
         self.done_path = self.vault_path / 'Done'
-        self.state_file = self.vault_path / '.watcher-state.json'
+        self.state_db = self.vault_path / '.watcher.db'
+        self.state_file = self.vault_path / '.watcher-state.json'  # Pre-SQLite watchers
         self.dry_run = dry_run
         self.logger = setup_logger('inbox_cleaner', self.vault_path / 'Logs')
 
     def load_watcher_state(self) -> dict:
         """
-        Load watcher state to see which files have been processed.
+        Load the JSON watcher state written by watchers before the SQLite state.
 
         Returns:
             State dictionary
@@ -48,8 +59,7 @@ class InboxCleaner:
             return {'processed_files': []}
 
         try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _json_loads(self.state_file.read_bytes())
         except Exception as e:
             self.logger.error(f"Error loading watcher state: {e}")
             return {'processed_files': []}
@@ -61,9 +71,59 @@ class InboxCleaner:
         Returns:
             Set of processed filenames
         """
+        if self.state_db.exists():
+            try:
+                conn = sqlite3.connect(f"{self.state_db.resolve().as_uri()}?mode=ro", uri=True)
+                try:
+                    return {filename for (filename,) in conn.execute('SELECT filename FROM processed')}
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error loading watcher state: {e}")
+                return set()
+
         state = self.load_watcher_state()
         return {item['filename'] for item in state.get('processed_files', [])}
 
+    def _build_done_index(self) -> set:
+        """
+        Collect the original filenames referenced by task files in Done folder.
+
+        Each task file is read once, and only up to the end of its frontmatter;
+        reads run in a thread pool so per-file latency overlaps.
+
+        Returns:
+            Set of original filenames with a task file in Done
+        """
+        task_files = list(self.done_path.glob('task-*.md'))
+        if not task_files:
+            return set()
+
+        with ThreadPoolExecutor(max_workers=min(16, len(task_files))) as executor:
+            names = executor.map(self._read_original_name, task_files)
+            return {name for name in names if name}
+
+    def _read_original_name(self, task_file: Path) -> Optional[str]:
+        """
+        Read the original filename recorded in a task file's frontmatter.
+
+        Args:
+            task_file: Path to task file in Done
+
+        Returns:
+            Original filename, or None if unreadable or missing
+        """
+        try:
+            metadata = read_frontmatter(str(task_file))
+        except Exception as e:
+            self.logger.warning(f"Error reading {task_file}: {e}")
+            return None
+
+        original_file = metadata.get('original_file') if isinstance(metadata, dict) else None
+        if isinstance(original_file, dict) and original_file.get('name'):
+            return original_file['name']
+        return None
+
     def verify_task_in_done(self, filename: str) -> bool:
         """
         Verify that a task file for this original file exists in Done folder.
@@ -74,19 +134,7 @@ class InboxCleaner:
         Returns:
             True if corresponding task file found in Done
         """
-        # Look for task files that reference this original file
-        for task_file in self.done_path.glob('task-*.md'):
-            try:
-                with open(task_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Check if this task file references the original file
-                    if f"name: {filename}" in content or filename in content:
-                        return True
-            except Exception as e:
-                self.logger.warning(f"Error reading {task_file}: {e}")
-                continue
-
-        return False
+        return filename in self._build_done_index()
 
     def get_files_to_clean(self) -> list:
         """
@@ -96,19 +144,24 @@ class InboxCleaner:
             List of (filepath, filename) tuples
         """
         processed_files = self.get_processed_files()
+        done_index = self._build_done_index()
         files_to_clean = []
 
         # Get all files in Inbox (excluding .gitkeep)
-        for file_path in self.inbox_path.glob('*'):
-            if file_path.name == '.gitkeep' or file_path.is_dir():
-                continue
+        try:
+            with os.scandir(self.inbox_path) as entries:
+                inbox_files = [entry.name for entry in entries
+                               if entry.name != '.gitkeep' and entry.is_file()]
+        except FileNotFoundError:
+            return files_to_clean
 
-            filename = file_path.name
+        for filename in inbox_files:
+            file_path = self.inbox_path / filename
 
             # Check if file was processed by watcher
             if filename in processed_files:
                 # Verify task file exists in Done
-                if self.verify_task_in_done(filename):
+                if filename in done_index:
                     files_to_clean.append((file_path, filename))
                     self.logger.info(f"Found processed file: {filename}")
                 else:
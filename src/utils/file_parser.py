@@ -5,10 +5,13 @@ Handles text extraction from PDFs and images.
 """
 
 import os
-from typing import Optional
+from pathlib import Path
 from pypdf import PdfReader
 from PIL import Image
 
+# Files larger than this are rejected instead of parsed
+MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024
+
 
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
@@ -21,11 +24,13 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         Extracted text content
     """
     try:
-        reader = PdfReader(pdf_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
+        # Large buffer so pypdf's many small seeks/reads hit memory, not syscalls
+        with open(pdf_path, 'rb', buffering=1 << 17) as f:
+            reader = PdfReader(f)
+            text = "\n".join(page.extract_text() or "" for page in reader.pages)
         return text.strip()
+    except PermissionError:
+        raise  # Callers report unreadable files themselves
     except Exception as e:
         return f"Error reading PDF: {e}"
 
@@ -49,57 +54,84 @@ def extract_text_from_image(image_path: str) -> dict:
             'mode': img.mode,
             'path': image_path
         }
+    except PermissionError:
+        raise
     except Exception as e:
         return {'error': str(e)}
 
 
-def get_file_content(file_path: str) -> str:
+def _file_ext(file_path: str) -> str:
     """
-    Universal file content extractor.
+    Get the lowercased extension used for content and MIME dispatch.
 
     Args:
         file_path: Path to file
 
     Returns:
-        File content or metadata string
+        Extension including the dot (e.g. '.pdf'), or '' if none
     """
-    if not os.path.exists(file_path):
-        return "[File not found]"
+    return os.path.splitext(file_path)[1].lower()
+
+
+def _pdf_content(file_path: str) -> str:
+    """Extract PDF text."""
+    return extract_text_from_pdf(file_path)
+
+
+def _image_content(file_path: str) -> str:
+    """Describe an image; the file itself goes to Claude's vision API."""
+    metadata = extract_text_from_image(file_path)
+    if 'error' in metadata:
+        return f"[Image error: {metadata['error']}]"
+    return f"[Image file: {metadata.get('format')} {metadata.get('size')}]"
+
+
+def _text_content(file_path: str) -> str:
+    """Read a text file in full."""
+    try:
+        return Path(file_path).read_text(encoding='utf-8')
+    except PermissionError:
+        raise
+    except Exception as e:
+        return f"[Error reading file: {e}]"
 
-    file_ext = os.path.splitext(file_path)[1].lower()
-
-    if file_ext == '.pdf':
-        return extract_text_from_pdf(file_path)
-    elif file_ext in ['.png', '.jpg', '.jpeg']:
-        # For images, return path for Claude vision API
-        metadata = extract_text_from_image(file_path)
-        if 'error' in metadata:
-            return f"[Image error: {metadata['error']}]"
-        return f"[Image file: {metadata.get('format')} {metadata.get('size')}]"
-    elif file_ext in ['.txt', '.md']:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
-            return f"[Error reading file: {e}]"
-    else:
-        return "[Unsupported file type]"
 
+_CONTENT_HANDLERS = {
+    '.pdf': _pdf_content,
+    '.png': _image_content,
+    '.jpg': _image_content,
+    '.jpeg': _image_content,
+    '.txt': _text_content,
+    '.md': _text_content
+}
 
-def is_file_too_large(file_path: str, max_size_mb: int = 10) -> bool:
+_MIME_TYPES = {
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    '.pdf': 'application/pdf',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg'
+}
+
+
+def get_file_content(file_path: str) -> str:
     """
-    Check if file exceeds size limit.
+    Universal file content extractor.
 
     Args:
         file_path: Path to file
-        max_size_mb: Maximum file size in MB
 
     Returns:
-        True if file is too large
+        File content or metadata string
     """
-    max_bytes = max_size_mb * 1024 * 1024
-    size = os.path.getsize(file_path)
-    return size > max_bytes
+    if not os.path.exists(file_path):
+        return "[File not found]"
+
+    handler = _CONTENT_HANDLERS.get(_file_ext(file_path))
+    if handler is None:
+        return "[Unsupported file type]"
+    return handler(file_path)
 
 
 def get_file_mime_type(file_path: str) -> str:
@@ -112,13 +144,4 @@ def get_file_mime_type(file_path: str) -> str:
     Returns:
         MIME type string
     """
-    ext = os.path.splitext(file_path)[1].lower()
-    mime_types = {
-        '.txt': 'text/plain',
-        '.md': 'text/markdown',
-        '.pdf': 'application/pdf',
-        '.png': 'image/png',
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg'
-    }
-    return mime_types.get(ext, 'application/octet-stream')
+    return _MIME_TYPES.get(_file_ext(file_path), 'application/octet-stream')
@@ -6,18 +6,29 @@ Handles logging to files and console with timestamps.
 
 import logging
 import os
+import traceback
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import MemoryHandler
 from pathlib import Path
+from typing import Iterable, Union
 
 
-def setup_logger(name: str, log_dir: str = "vault/Logs", level: str = "INFO") -> logging.Logger:
+@lru_cache(maxsize=None)
+def setup_logger(name: str, log_dir: str = "vault/Logs", level: str = "INFO",
+                 buffered: bool = True) -> logging.Logger:
     """
     Setup logger with file and console handlers.
 
+    Results are cached, so repeated calls from each component's constructor
+    return the configured logger without touching the filesystem again.
+
     Args:
         name: Logger name
         log_dir: Directory for log files
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
+        buffered: Batch file writes. Long-running processes such as the
+            watcher pass False so their log files stay current.
 
     Returns:
         Configured logger instance
@@ -48,26 +59,35 @@ def setup_logger(name: str, log_dir: str = "vault/Logs", level: str = "INFO") ->
 
     # Add handlers
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    if buffered:
+        # Batch file writes; warnings, a full buffer and interpreter exit flush it
+        memory_handler = MemoryHandler(capacity=256, flushLevel=logging.WARNING, target=file_handler)
+        memory_handler.setLevel(logging.DEBUG)
+        logger.addHandler(memory_handler)
+    else:
+        logger.addHandler(file_handler)
 
     return logger
 
 
-def log_to_file(log_dir: str, filename: str, content: str):
+def log_to_file(log_dir: str, filename: str, content: Union[str, Iterable[str]]):
     """
     Write content to a log file.
 
     Args:
         log_dir: Directory for log files
         filename: Log filename
-        content: Content to write
+        content: Content to write, or an iterable of entries to append in
+            one batch under a shared timestamp
     """
     Path(log_dir).mkdir(parents=True, exist_ok=True)
     log_path = os.path.join(log_dir, filename)
 
-    with open(log_path, 'a', encoding='utf-8') as f:
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        f.write(f"[{timestamp}] {content}\n")
+    entries = [content] if isinstance(content, str) else content
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    with open(log_path, 'a', encoding='utf-8', buffering=65536) as f:
+        f.writelines(f"[{timestamp}] {entry}\n" for entry in entries)
 
 
 def create_error_log(log_dir: str, error: Exception, context: str = "") -> str:
@@ -82,12 +102,19 @@ def create_error_log(log_dir: str, error: Exception, context: str = "") -> str:
     Returns:
         Path to created error log file
     """
-    timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    now = datetime.now()
+    # Microseconds keep names unique when several workers fail in the same second
+    timestamp = now.strftime('%Y%m%d-%H%M%S-%f')
     filename = f"error-{timestamp}.md"
 
+    if error.__traceback__ is not None:
+        stack_trace = ''.join(traceback.format_exception(type(error), error, error.__traceback__)).rstrip()
+    else:
+        stack_trace = 'No traceback available'
+
     content = f"""# Error Log
 
-**Timestamp**: {datetime.now().isoformat()}
+**Timestamp**: {now.isoformat()}
 **Context**: {context}
 
 ## Error Details
@@ -98,7 +125,7 @@ def create_error_log(log_dir: str, error: Exception, context: str = "") -> str:
 ## Stack Trace
 
 ```
-{error.__traceback__ if hasattr(error, '__traceback__') else 'No traceback available'}
+{stack_trace}
 ```
 
 ## Resolution
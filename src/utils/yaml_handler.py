@@ -6,7 +6,46 @@ Handles reading and writing YAML frontmatter in markdown files.
 
 import yaml
 import re
-from typing import Dict, Tuple, Any
+from typing import Dict, Optional, Tuple, Any
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Frontmatter pattern: --- ... --- (fallback for what the slicer rejects)
+_FM_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+
+
+def _split_frontmatter(content: str) -> Optional[Tuple[str, str]]:
+    """
+    Split canonical frontmatter (as written by write_frontmatter) by slicing.
+
+    Only handles files that open with exactly "---\\n"; anything else is
+    left to the regex in parse_frontmatter, which defines the semantics.
+
+    Args:
+        content: Full file content
+
+    Returns:
+        Tuple of (yaml_content, markdown_content), or None if not canonical
+    """
+    if len(content) < 5 or not content.startswith('---\n') or content[4].isspace():
+        return None
+
+    # First "\n---" whose trailing whitespace reaches a newline closes the block
+    end = content.find('\n---', 4)
+    while end != -1:
+        pos = end + 4
+        body_start = -1
+        while pos < len(content) and content[pos].isspace():
+            if content[pos] == '\n':
+                body_start = pos + 1
+            pos += 1
+        if body_start != -1:
+            return content[4:end], content[body_start:]
+        end = content.find('\n---', end + 1)
+
+    return None
 
 
 def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
@@ -19,24 +58,85 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     Returns:
         Tuple of (metadata_dict, markdown_content)
     """
-    # Match frontmatter pattern: --- ... ---
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
+    parts = _split_frontmatter(content)
+    if parts is None:
+        match = _FM_RE.match(content)
 
-    if not match:
-        return {}, content
+        if not match:
+            return {}, content
 
-    yaml_content = match.group(1)
-    markdown_content = match.group(2)
+        parts = match.group(1), match.group(2)
+
+    yaml_content, markdown_content = parts
 
     try:
-        metadata = yaml.safe_load(yaml_content)
+        metadata = yaml.load(yaml_content, Loader=_SafeLoader)
         return metadata or {}, markdown_content
     except yaml.YAMLError as e:
         print(f"YAML parsing error: {e}")
         return {}, content
 
 
+def parse_frontmatter_only(yaml_content: str) -> Dict[str, Any]:
+    """
+    Parse a YAML frontmatter block that has already been split from its file.
+
+    Args:
+        yaml_content: YAML text between the --- delimiters
+
+    Returns:
+        Metadata dictionary
+    """
+    try:
+        return yaml.load(yaml_content, Loader=_SafeLoader) or {}
+    except yaml.YAMLError as e:
+        print(f"YAML parsing error: {e}")
+        return {}
+
+
+def read_frontmatter_block(file_path: str) -> Optional[bytes]:
+    """
+    Read the raw YAML frontmatter block of a markdown file.
+
+    Reading stops at the closing --- delimiter, so the markdown body is
+    never loaded.
+
+    Args:
+        file_path: Path to markdown file
+
+    Returns:
+        Raw bytes between the --- delimiters, or None if there is no frontmatter
+    """
+    with open(file_path, 'rb') as f:
+        first_line = f.readline()
+        if first_line.rstrip() != b'---' or not first_line.endswith(b'\n'):
+            return None
+
+        lines = []
+        for line in f:
+            if line.rstrip() == b'---' and line.endswith(b'\n'):
+                return b''.join(lines)
+            lines.append(line)
+
+    return None
+
+
+def read_frontmatter(file_path: str) -> Dict[str, Any]:
+    """
+    Read only the YAML frontmatter of a markdown file.
+
+    Args:
+        file_path: Path to markdown file
+
+    Returns:
+        Metadata dictionary (empty if the file has no frontmatter)
+    """
+    block = read_frontmatter_block(file_path)
+    if block is None:
+        return {}
+    return parse_frontmatter_only(block.decode('utf-8', errors='replace'))
+
+
 def write_frontmatter(metadata: Dict[str, Any], markdown_content: str) -> str:
     """
     Combine metadata and markdown into single file content.
@@ -48,7 +148,7 @@ def write_frontmatter(metadata: Dict[str, Any], markdown_content: str) -> str:
     Returns:
         Complete file content with frontmatter
     """
-    yaml_content = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+    yaml_content = yaml.dump(metadata, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
     return f"---\n{yaml_content}---\n\n{markdown_content}"
 
 
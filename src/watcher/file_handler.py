@@ -6,11 +6,44 @@ Handles file system events for the Inbox folder.
 
 import os
 import time
-from watchdog.events import FileSystemEventHandler
-from ..utils.logger import setup_logger
+import heapq
+import queue
+import threading
+from collections import OrderedDict
+from watchdog.events import EVENT_TYPE_CLOSED, EVENT_TYPE_CREATED, PatternMatchingEventHandler
+from ..utils.file_parser import MAX_FILE_SIZE_BYTES
+from ..utils.logger import setup_logger, create_error_log
 
+# File types the watcher creates tasks for, shared by every handler
+SUPPORTED_EXTENSIONS = frozenset({'.txt', '.md', '.pdf', '.png', '.jpg', '.jpeg'})
 
-class FileHandler(FileSystemEventHandler):
+# Only these events can start task creation
+TRIGGER_EVENT_TYPES = frozenset({EVENT_TYPE_CREATED, EVENT_TYPE_CLOSED})
+
+# Most recent (event type, path) pairs remembered for debouncing
+DEBOUNCE_MAX_ENTRIES = 4096
+DEBOUNCE_SECONDS = 1.0
+
+# A file created without a close event (or found by the startup scan) is
+# only read once two stats this far apart agree, so a copy still in
+# progress isn't captured half-written; give up waiting after the timeout
+STABLE_CHECK_INTERVAL = 1.0
+STABLE_TIMEOUT_SECONDS = 60.0
+
+
+class _PendingFile:
+    """Queue state for one Inbox path between enqueue and task creation."""
+
+    __slots__ = ('wait_for_stable', 'due', 'last_stat', 'first_seen')
+
+    def __init__(self, wait_for_stable: bool):
+        self.wait_for_stable = wait_for_stable
+        self.due = None  # Not-before time while parked on the delayed heap
+        self.last_stat = None  # (size, mtime_ns) seen by the previous check
+        self.first_seen = time.monotonic()
+
+
+class FileHandler(PatternMatchingEventHandler):
     """Handles file system events in the Inbox folder."""
 
     def __init__(self, vault_path: str, task_creator):
@@ -21,100 +54,297 @@ class FileHandler(FileSystemEventHandler):
             vault_path: Path to vault root
             task_creator: TaskCreator instance for creating tasks
         """
+        # Let watchdog drop directories, unsupported types, editor swap
+        # files and dotfiles before they are dispatched to on_created/on_closed
+        super().__init__(
+            patterns=[f"*{ext}" for ext in sorted(SUPPORTED_EXTENSIONS)],
+            ignore_patterns=['*.tmp', '*.swp', '.*'],
+            ignore_directories=True,
+            case_sensitive=False
+        )
+
         self.vault_path = vault_path
         self.task_creator = task_creator
-        self.logger = setup_logger('file_handler', os.path.join(vault_path, 'Logs'))
-        self.last_event = {}  # For debouncing
-        self.supported_extensions = ['.txt', '.md', '.pdf', '.png', '.jpg', '.jpeg']
+        self._logs_dir = os.path.join(vault_path, 'Logs')
+        self.logger = setup_logger('file_handler', self._logs_dir, buffered=False)
+        self.last_event = OrderedDict()  # For debouncing, oldest first
 
-    def on_created(self, event):
+        # The observer thread only enqueues paths; worker_count threads
+        # running run_worker do the blocking checks and task creation, so
+        # a burst of files is read and written concurrently. A full queue
+        # blocks the observer thread, leaving the backlog in watchdog's
+        # own (unbounded) event queue rather than dropping files
+        self.worker_count = min(8, os.cpu_count() or 2)
+        self._work_q = queue.Queue(maxsize=1024)
+        self._stop = threading.Event()
+
+        # One entry per queued path, so a created and a closed event for the
+        # same file share a queue slot. Files still being written wait on
+        # _delayed, a heap of (not-before, path), instead of in a worker.
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._delayed = []
+
+    def dispatch(self, event):
         """
-        Handle file creation event with comprehensive error handling.
+        Drop every event except file creation and close before pattern matching.
+
+        For Bronze tier, we only care about new files, not modifications,
+        so the common modify spam costs a single type check. The native
+        Linux observer reports a finished write as a closed event.
 
         Args:
             event: FileSystemEvent from watchdog
         """
-        if event.is_directory:
+        if event.event_type not in TRIGGER_EVENT_TYPES or event.is_directory:
             return
+        super().dispatch(event)
+
+    def on_created(self, event):
+        """
+        Handle file creation event by queueing it for the worker.
+
+        Only supported, non-ignored files reach here (see __init__). The
+        file may still be being written, so it is only read once it stops
+        changing; files moved into the Inbox never get a closed event.
+
+        Args:
+            event: FileSystemEvent from watchdog
+        """
+        self._handle_new_file(event, wait_for_stable=True)
+
+    def on_closed(self, event):
+        """
+        Handle a file closed after writing by queueing it for the worker.
 
+        Only emitted by the native Linux (inotify) observer. The writer is
+        done, so this cancels any stability wait from the created event.
+
+        Args:
+            event: FileSystemEvent from watchdog
+        """
+        self._handle_new_file(event, wait_for_stable=False)
+
+    def _handle_new_file(self, event, wait_for_stable: bool):
+        """
+        Debounce an event and queue its file for the worker.
+
+        Args:
+            event: FileSystemEvent from watchdog
+            wait_for_stable: Whether the worker must wait for the file to
+                stop changing before reading it
+        """
         file_path = event.src_path
 
-        # Debounce: ignore if same file within 1 second
+        # Debounce: ignore if same event for the same file within 1 second.
+        # Keyed by event type so a close right after the create still counts.
+        key = (event.event_type, file_path)
         now = time.time()
-        if file_path in self.last_event:
-            if now - self.last_event[file_path] < 1.0:
-                self.logger.debug(f"Debounced duplicate event for {file_path}")
+        if key in self.last_event:
+            if now - self.last_event[key] < DEBOUNCE_SECONDS:
+                self.logger.debug("Debounced duplicate event for %s", file_path)
                 return
 
-        self.last_event[file_path] = now
+        self.last_event[key] = now
+        self.last_event.move_to_end(key)
 
-        # Validate file exists (may have been deleted quickly)
-        if not os.path.exists(file_path):
-            self.logger.warning(f"File no longer exists: {file_path}")
-            return
+        # Entries past the window can't debounce anything; keep memory bounded
+        while self.last_event:
+            oldest_time = next(iter(self.last_event.values()))
+            if len(self.last_event) <= DEBOUNCE_MAX_ENTRIES and now - oldest_time < DEBOUNCE_SECONDS:
+                break
+            self.last_event.popitem(last=False)
 
-        # Filter file types
-        file_ext = os.path.splitext(file_path)[1].lower()
-        if file_ext not in self.supported_extensions:
-            self.logger.info(f"Skipping unsupported file type: {file_path}")
-            return
+        self.enqueue(file_path, wait_for_stable)
 
-        # Check file size
+    def enqueue(self, file_path: str, wait_for_stable: bool = True) -> bool:
+        """
+        Queue a file for task creation by the worker.
+
+        A path that is already pending isn't queued again; enqueueing it
+        with wait_for_stable=False only cancels its stability wait. Blocks
+        while the queue is full; files are never dropped.
+
+        Args:
+            file_path: Path to file in Inbox
+            wait_for_stable: Whether the worker must wait for the file to
+                stop changing before reading it
+
+        Returns:
+            True if the file was not already pending
+        """
+        with self._lock:
+            pending = self._pending.get(file_path)
+            if pending is None:
+                self._pending[file_path] = _PendingFile(wait_for_stable)
+            else:
+                if wait_for_stable or not pending.wait_for_stable:
+                    return False
+                pending.wait_for_stable = False
+                if pending.due is None:
+                    return False  # Still queued or being processed
+                pending.due = None  # Leaves its _delayed entry stale
+        self._work_q.put(file_path)
+        return pending is None
+
+    def run_worker(self):
+        """Process queued files until stop() is called; run in worker_count threads."""
+        while True:
+            file_path = self._next_path()
+            if file_path is None:
+                return  # Sentinel from stop()
+            try:
+                self._handle_pending(file_path)
+            except Exception as e:
+                self.logger.error("Unexpected error handling %s: %s", file_path, e)
+
+    def _next_path(self):
+        """
+        Take the next path to work on: a due stability re-check, else the queue.
+
+        Returns:
+            File path, or None once stop() has been called
+        """
+        while True:
+            timeout = None
+            with self._lock:
+                while self._delayed:
+                    due, file_path = self._delayed[0]
+                    pending = self._pending.get(file_path)
+                    if pending is None or pending.due != due:
+                        heapq.heappop(self._delayed)  # Closed or handled since
+                        continue
+                    timeout = due - time.monotonic()
+                    if timeout <= 0:
+                        heapq.heappop(self._delayed)
+                        pending.due = None
+                        return file_path
+                    break
+            try:
+                return self._work_q.get(timeout=timeout)
+            except queue.Empty:
+                continue  # A delayed re-check is due
+
+    def _handle_pending(self, file_path: str):
+        """
+        Create the task for a pending file once it has stopped changing.
+
+        Args:
+            file_path: Path to file in Inbox
+        """
+        deferred = False
         try:
-            from ..utils.file_parser import is_file_too_large
-            if is_file_too_large(file_path):
-                self.logger.warning(f"File too large (>10MB): {file_path}")
-                self._handle_oversized_file(file_path)
+            if self.task_creator.is_file_processed(os.path.basename(file_path)):
+                self.logger.debug("Already processed, skipping: %s", file_path)
                 return
-        except Exception as e:
-            self.logger.error(f"Error checking file size for {file_path}: {e}")
-            return
+            deferred = self._defer_until_settled(file_path)
+            if not deferred:
+                self._process_file(file_path)
+        finally:
+            if not deferred:
+                with self._lock:
+                    self._pending.pop(file_path, None)
+
+    def _defer_until_settled(self, file_path: str) -> bool:
+        """
+        Park a file that may still be being written on the delayed heap.
+
+        The file is ready once two checks STABLE_CHECK_INTERVAL apart see
+        the same size and mtime, or a closed event has cancelled the wait.
 
-        # Validate file is readable
+        Args:
+            file_path: Path to file in Inbox
+
+        Returns:
+            True if the file was deferred, False if it is ready to process
+        """
         try:
-            with open(file_path, 'rb') as f:
-                f.read(1)  # Try to read first byte
-        except PermissionError:
-            self.logger.error(f"Permission denied reading file: {file_path}")
-            self._handle_permission_error(file_path)
+            st = os.stat(file_path)
+        except OSError:
+            return False  # _process_file reports it
+
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending[file_path]
+            if not pending.wait_for_stable or pending.last_stat == (st.st_size, st.st_mtime_ns):
+                return False
+            if now - pending.first_seen >= STABLE_TIMEOUT_SECONDS:
+                self.logger.warning("File still changing after %ss, processing anyway: %s", STABLE_TIMEOUT_SECONDS, file_path)
+                return False
+            pending.last_stat = (st.st_size, st.st_mtime_ns)
+            pending.due = now + STABLE_CHECK_INTERVAL
+            heapq.heappush(self._delayed, (pending.due, file_path))
+        return True
+
+    def _process_file(self, file_path: str):
+        """
+        Validate a new Inbox file and create its task, with comprehensive error handling.
+
+        Args:
+            file_path: Path to file in Inbox
+        """
+        # Stat validates the file exists (may have been deleted quickly)
+        # and gives its final size
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            self.logger.warning("File no longer exists: %s", file_path)
+            return
+        except OSError as e:
+            self.logger.error("Error checking file size for %s: %s", file_path, e)
             return
-        except Exception as e:
-            self.logger.error(f"File not readable: {file_path} - {e}")
+
+        # Check file size
+        if st.st_size > MAX_FILE_SIZE_BYTES:
+            self.logger.warning("File too large (>10MB): %s", file_path)
+            self._handle_oversized_file(file_path)
             return
 
-        # Create task with retry logic
+        # Create task with retry logic; an unreadable file surfaces as a
+        # PermissionError from reading its content, handled below
         max_retries = 3
         retry_delay = 2  # seconds
 
         for attempt in range(max_retries):
             try:
-                self.logger.info(f"New file detected: {os.path.basename(file_path)} (attempt {attempt + 1}/{max_retries})")
+                self.logger.info("New file detected: %s (attempt %s/%s)", os.path.basename(file_path), attempt + 1, max_retries)
                 task = self.task_creator.create_task_from_file(file_path)
-                self.logger.info(f"Task created: {task.metadata['id']}")
+                if task is not None:  # None: already processed
+                    self.logger.info("Task created: %s", task.metadata['id'])
                 return  # Success, exit
             except FileNotFoundError:
-                self.logger.error(f"File disappeared during processing: {file_path}")
+                self.logger.error("File disappeared during processing: %s", file_path)
                 return  # Don't retry if file is gone
             except PermissionError as e:
-                self.logger.error(f"Permission error creating task: {file_path} - {e}")
+                self.logger.error("Permission error creating task: %s - %s", file_path, e)
                 self._handle_permission_error(file_path)
                 return  # Don't retry permission errors
             except Exception as e:
-                self.logger.error(f"Error creating task for {file_path} (attempt {attempt + 1}/{max_retries}): {e}")
+                self.logger.error("Error creating task for %s (attempt %s/%s): %s", file_path, attempt + 1, max_retries, e)
 
                 if attempt < max_retries - 1:
-                    self.logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    self.logger.info("Retrying in %s seconds...", retry_delay)
+                    if self._stop.wait(retry_delay):
+                        return  # Watcher is shutting down
                 else:
                     # Final failure - log error
-                    self.logger.error(f"Failed to create task after {max_retries} attempts: {file_path}")
-                    from ..utils.logger import create_error_log
+                    self.logger.error("Failed to create task after %s attempts: %s", max_retries, file_path)
                     create_error_log(
-                        os.path.join(self.vault_path, 'Logs'),
+                        self._logs_dir,
                         e,
                         f"Failed to create task from file after {max_retries} attempts: {file_path}"
                     )
 
+    def stop(self):
+        """
+        Cancel pending retry waits and let the workers exit once the queue drains.
+
+        Files still waiting to settle are left for the next startup scan.
+        """
+        self._stop.set()
+        for _ in range(self.worker_count):
+            self._work_q.put(None)
+
     def _handle_oversized_file(self, file_path: str):
         """
         Handle oversized file by creating error log.
@@ -122,10 +352,9 @@ class FileHandler(FileSystemEventHandler):
         Args:
             file_path: Path to oversized file
         """
-        from ..utils.logger import create_error_log
         error = ValueError(f"File exceeds 10MB size limit: {os.path.basename(file_path)}")
         create_error_log(
-            os.path.join(self.vault_path, 'Logs'),
+            self._logs_dir,
             error,
             f"File too large to process: {file_path}"
         )
@@ -137,20 +366,9 @@ class FileHandler(FileSystemEventHandler):
         Args:
             file_path: Path to file with permission issues
         """
-        from ..utils.logger import create_error_log
         error = PermissionError(f"Cannot read file: {os.path.basename(file_path)}")
         create_error_log(
-            os.path.join(self.vault_path, 'Logs'),
+            self._logs_dir,
             error,
             f"Permission denied: {file_path}"
         )
-
-    def on_modified(self, event):
-        """
-        Handle file modification event.
-
-        Args:
-            event: FileSystemEvent from watchdog
-        """
-        # For Bronze tier, we only care about new files, not modifications
-        pass
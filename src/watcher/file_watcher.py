@@ -7,18 +7,57 @@ Monitors Inbox folder for new files and creates tasks.
 import os
 import sys
 import time
+import signal
 import argparse
+import threading
 from pathlib import Path
-from watchdog.observers.polling import PollingObserver as Observer
+from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.watcher.file_handler import FileHandler
+from src.watcher.file_handler import FileHandler, SUPPORTED_EXTENSIONS
 from src.watcher.task_creator import TaskCreator
 from src.utils.logger import setup_logger
 
+# Filesystems that don't deliver inotify events for changes made elsewhere
+# (WSL's /mnt drives, network shares), so they need a polling observer;
+# SQLite's WAL mode isn't supported on them either
+POLLING_FS_TYPES = frozenset({'9p', 'v9fs', 'drvfs', 'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs'})
+
+
+def needs_polling(path: str) -> bool:
+    """
+    Check whether a path lives on a filesystem without native change events.
+
+    Args:
+        path: Directory to be watched
+
+    Returns:
+        True if the mount containing path is a known network/9p filesystem
+    """
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            mounts = f.read().splitlines()
+    except OSError:
+        return False  # Not Linux; the native observer is reliable there
+
+    # The longest mount point that prefixes the path is the one it lives on
+    real_path = os.path.realpath(path)
+    best_mount, best_type = '', ''
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount_point = fields[1].replace('\\040', ' ')
+        if (real_path == mount_point or real_path.startswith(mount_point.rstrip('/') + '/')) \
+                and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fields[2]
+
+    return best_type in POLLING_FS_TYPES
+
 
 def main():
     """Main entry point for file watcher."""
@@ -26,6 +65,8 @@ def main():
     parser = argparse.ArgumentParser(description='Bronze Tier File Watcher')
     parser.add_argument('--vault', type=str, default='./vault',
                         help='Path to vault directory')
+    parser.add_argument('--polling', action='store_true',
+                        help='Poll the Inbox instead of using native file system events')
     args = parser.parse_args()
 
     # Load environment variables
@@ -46,39 +87,85 @@ def main():
         sys.exit(1)
 
     # Setup logger
-    logger = setup_logger('file_watcher', os.path.join(vault_path, 'Logs'))
+    logger = setup_logger('file_watcher', os.path.join(vault_path, 'Logs'), buffered=False)
 
-    # Create task creator
-    task_creator = TaskCreator(vault_path)
+    # Create task creator; SQLite's WAL mode doesn't work on the same
+    # network/9p mounts (e.g. WSL's /mnt drives) that need polling
+    use_wal = not needs_polling(vault_path)
+    if not use_wal:
+        logger.info("Vault is on a network filesystem; state database uses a rollback journal")
+    task_creator = TaskCreator(vault_path, use_wal=use_wal)
 
-    # Create event handler
+    # Create event handler and the worker threads that create its tasks
     event_handler = FileHandler(vault_path, task_creator)
-
-    # Create observer
-    observer = Observer()
+    workers = [
+        threading.Thread(target=event_handler.run_worker, name=f'task-creation-{i}', daemon=True)
+        for i in range(event_handler.worker_count)
+    ]
+    for worker in workers:
+        worker.start()
+
+    # Create observer: native events (inotify/FSEvents/ReadDirectoryChangesW)
+    # idle at ~0 CPU; polling is only needed where those events don't arrive
+    if args.polling or needs_polling(inbox_path):
+        poll_interval = float(os.getenv('WATCHER_POLL_INTERVAL', '1.0'))
+        observer = PollingObserver(timeout=poll_interval)
+        logger.info(f"Using polling observer (every {poll_interval}s)")
+    else:
+        observer = Observer()
+        logger.info("Using native file system observer")
     observer.schedule(event_handler, inbox_path, recursive=False)
 
     # Start observer
+    started_at = time.time()
     observer.start()
+
+    # Queue files that arrived while the watcher was down; anything created
+    # from here on is also seen by the observer, and duplicates are skipped.
+    # enqueue blocks while the queue is full, so none of them is lost, and
+    # files last written before startup are already complete.
+    missed = 0
+    with os.scandir(inbox_path) as entries:
+        for entry in entries:
+            if (not entry.name.startswith('.') and entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                    and not task_creator.is_file_processed(entry.name)):
+                wait_for_stable = entry.stat().st_mtime >= started_at
+                if event_handler.enqueue(entry.path, wait_for_stable):
+                    missed += 1
+    if missed:
+        logger.info(f"Queued {missed} file(s) added while the watcher was stopped")
     logger.info("File watcher started")
     logger.info(f"Monitoring: {inbox_path}")
-    logger.info("Supported types: .txt, .md, .pdf, .png, .jpg, .jpeg")
+    supported_types = ', '.join(sorted(SUPPORTED_EXTENSIONS))
+    logger.info(f"Supported types: {supported_types}")
     logger.info("Press Ctrl+C to stop")
 
     print("[INFO] File watcher started")
     print(f"[INFO] Monitoring: {inbox_path}")
-    print("[INFO] Supported types: .txt, .md, .pdf, .png, .jpg, .jpeg")
+    print(f"[INFO] Supported types: {supported_types}")
     print("[INFO] Press Ctrl+C to stop")
 
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Stopping file watcher...")
-        print("\n[INFO] Stopping file watcher...")
-        observer.stop()
-
+    # Block until Ctrl+C (or SIGTERM) instead of waking every second
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    if os.name == 'nt':
+        # Windows can't interrupt an untimed lock wait, so the signal
+        # handler would never run; wake up once a second to let it
+        while not stop_event.wait(1.0):
+            pass
+    else:
+        stop_event.wait()
+
+    logger.info("Stopping file watcher...")
+    print("\n[INFO] Stopping file watcher...")
+    observer.stop()
     observer.join()
+    event_handler.stop()
+    for worker in workers:
+        worker.join()
+    task_creator.close()
     logger.info("File watcher stopped")
     print("[INFO] File watcher stopped")
 
@@ -6,54 +6,107 @@ Handles task file creation and state tracking.
 
 import os
 import json
+import sqlite3
+import threading
 from datetime import datetime, timezone
 from ..models.task_file import TaskFile
 from ..utils.logger import setup_logger
 
+WATCHER_VERSION = '1.0.0'
+
+# Indexed state: membership checks and updates touch one row, not the
+# whole history as with the old JSON file
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed (
+    filename TEXT PRIMARY KEY,
+    processed_at TEXT NOT NULL,
+    task_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending (
+    task_id TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
 
 class TaskCreator:
     """Creates task files from files dropped in Inbox."""
 
-    def __init__(self, vault_path: str):
+    def __init__(self, vault_path: str, use_wal: bool = True):
         """
         Initialize TaskCreator.
 
         Args:
             vault_path: Path to vault root
+            use_wal: Open the state database in WAL mode. WAL needs shared
+                memory, so pass False for vaults on network/9p filesystems
         """
         self.vault_path = vault_path
-        self.logger = setup_logger('task_creator', os.path.join(vault_path, 'Logs'))
-        self.state_file = os.path.join(vault_path, '.watcher-state.json')
-        self.state = self._load_state()
-
-    def _load_state(self) -> dict:
-        """
-        Load watcher state from file.
+        self.logger = setup_logger('task_creator', os.path.join(vault_path, 'Logs'), buffered=False)
+        self.db_path = os.path.join(vault_path, '.watcher.db')
+        self.legacy_state_file = os.path.join(vault_path, '.watcher-state.json')
+
+        # One connection shared by the watcher threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._in_progress = set()  # Filenames claimed by a worker, not yet recorded
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(f"PRAGMA journal_mode={'WAL' if use_wal else 'DELETE'}")
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('watcher_version', ?)",
+                (WATCHER_VERSION,)
+            )
+        self._migrate_legacy_state()
+
+    def _migrate_legacy_state(self):
+        """Import a .watcher-state.json left by an older watcher, then retire it."""
+        if not os.path.exists(self.legacy_state_file):
+            return
 
-        Returns:
-            State dictionary
-        """
-        if os.path.exists(self.state_file):
-            try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                self.logger.warning(f"Could not load state file: {e}")
-
-        return {
-            'last_scan': datetime.now(timezone.utc).isoformat(),
-            'processed_files': [],
-            'pending_tasks': [],
-            'watcher_version': '1.0.0'
-        }
-
-    def _save_state(self):
-        """Save watcher state to file."""
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2)
+            with open(self.legacy_state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
         except Exception as e:
-            self.logger.error(f"Could not save state file: {e}")
+            self.logger.warning("Could not load state file: %s", e)
+            return
+
+        if not isinstance(state, dict):
+            self.logger.warning("Could not load state file: unexpected format in %s", self.legacy_state_file)
+            return
+
+        # Skip malformed entries rather than failing startup over them
+        processed = []
+        skipped = 0
+        for f in state.get('processed_files') or []:
+            if isinstance(f, dict) and f.get('filename'):
+                processed.append((f['filename'], f.get('processed_at') or '', f.get('task_id') or ''))
+            else:
+                skipped += 1
+        if skipped:
+            self.logger.warning("Skipped %s malformed entries in %s", skipped, self.legacy_state_file)
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO processed (filename, processed_at, task_id) VALUES (?, ?, ?)',
+                processed
+            )
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO pending (task_id) VALUES (?)',
+                [(task_id,) for task_id in state.get('pending_tasks') or [] if isinstance(task_id, str)]
+            )
+
+        os.replace(self.legacy_state_file, f"{self.legacy_state_file}.migrated")
+        self.logger.info("Migrated %s processed files from %s", len(processed), self.legacy_state_file)
+
+    def close(self):
+        """Close the state database."""
+        with self._lock:
+            self._conn.close()
 
     def is_file_processed(self, filename: str) -> bool:
         """
@@ -65,7 +118,32 @@ class TaskCreator:
         Returns:
             True if already processed
         """
-        return any(f['filename'] == filename for f in self.state['processed_files'])
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM processed WHERE filename = ? LIMIT 1', (filename,)
+            ).fetchone()
+        return row is not None
+
+    def _claim(self, filename: str) -> bool:
+        """
+        Atomically check that a file is unprocessed and mark it in progress.
+
+        Args:
+            filename: Filename to claim
+
+        Returns:
+            True if the caller should create the task
+        """
+        with self._lock:
+            if filename in self._in_progress:
+                return False
+            row = self._conn.execute(
+                'SELECT 1 FROM processed WHERE filename = ? LIMIT 1', (filename,)
+            ).fetchone()
+            if row is not None:
+                return False
+            self._in_progress.add(filename)
+            return True
 
     def create_task_from_file(self, file_path: str) -> TaskFile:
         """
@@ -79,25 +157,31 @@ class TaskCreator:
         """
         filename = os.path.basename(file_path)
 
-        # Check if already processed
-        if self.is_file_processed(filename):
-            self.logger.info(f"File already processed: {filename}")
+        # Check if already processed, and claim the file so a concurrent
+        # worker handling a duplicate event for it backs off
+        if not self._claim(filename):
+            self.logger.info("File already processed: %s", filename)
             return None
 
-        # Create task file
-        task = TaskFile.create_from_file(file_path, self.vault_path)
-
-        # Update state
-        self.state['processed_files'].append({
-            'filename': filename,
-            'processed_at': datetime.now(timezone.utc).isoformat(),
-            'task_id': task.metadata['id']
-        })
-        self.state['pending_tasks'].append(task.metadata['id'])
-        self.state['last_scan'] = datetime.now(timezone.utc).isoformat()
-        self._save_state()
-
-        self.logger.info(f"Created task {task.metadata['id']} from {filename}")
+        try:
+            # Create task file
+            task = TaskFile.create_from_file(file_path, self.vault_path)
+            task_id = task.metadata['id']
+
+            # Update state
+            now_iso = datetime.now(timezone.utc).isoformat()
+            with self._lock, self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO processed (filename, processed_at, task_id) VALUES (?, ?, ?)',
+                    (filename, now_iso, task_id)
+                )
+                self._conn.execute('INSERT OR IGNORE INTO pending (task_id) VALUES (?)', (task_id,))
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_scan', ?)", (now_iso,))
+        finally:
+            with self._lock:
+                self._in_progress.discard(filename)
+
+        self.logger.info("Created task %s from %s", task_id, filename)
 
         return task
 
@@ -108,9 +192,8 @@ class TaskCreator:
         Args:
             task_id: Task ID to mark completed
         """
-        if task_id in self.state['pending_tasks']:
-            self.state['pending_tasks'].remove(task_id)
-            self._save_state()
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM pending WHERE task_id = ?', (task_id,))
 
     def get_pending_tasks(self) -> list:
         """
@@ -119,4 +202,6 @@ class TaskCreator:
         Returns:
             List of task IDs
         """
-        return self.state['pending_tasks']
+        with self._lock:
+            rows = self._conn.execute('SELECT task_id FROM pending ORDER BY rowid').fetchall()
+        return [task_id for (task_id,) in rows]